@@ -1,5 +1,13 @@
 from ..signature import SignatureTree
-from struct import pack
+from struct import Struct
+
+PACK_INT16 = Struct('<h').pack
+PACK_UINT16 = Struct('<H').pack
+PACK_INT32 = Struct('<i').pack
+PACK_UINT32 = Struct('<I').pack
+PACK_INT64 = Struct('<q').pack
+PACK_UINT64 = Struct('<Q').pack
+PACK_DOUBLE = Struct('<d').pack
 
 
 class Marshaller:
@@ -30,10 +38,10 @@ class Marshaller:
         }
 
     def align(self, n):
-        offset = n - len(self.buffer) % n
-        if offset == 0 or offset == n:
-            return 0
-        self.buffer.extend(bytes(offset))
+        # n is always a power of two, see the Unmarshaller for the formula
+        offset = -len(self.buffer) & (n - 1)
+        if offset:
+            self.buffer.extend(bytes(offset))
         return offset
 
     def write_byte(self, byte, _=None):
@@ -48,37 +56,37 @@ class Marshaller:
 
     def write_int16(self, int16, _=None):
         written = self.align(2)
-        self.buffer.extend(pack('<h', int16))
+        self.buffer.extend(PACK_INT16(int16))
         return written + 2
 
     def write_uint16(self, uint16, _=None):
         written = self.align(2)
-        self.buffer.extend(pack('<H', uint16))
+        self.buffer.extend(PACK_UINT16(uint16))
         return written + 2
 
     def write_int32(self, int32, _):
         written = self.align(4)
-        self.buffer.extend(pack('<i', int32))
+        self.buffer.extend(PACK_INT32(int32))
         return written + 4
 
     def write_uint32(self, uint32, _=None):
         written = self.align(4)
-        self.buffer.extend(pack('<I', uint32))
+        self.buffer.extend(PACK_UINT32(uint32))
         return written + 4
 
     def write_int64(self, int64, _=None):
         written = self.align(8)
-        self.buffer.extend(pack('<q', int64))
+        self.buffer.extend(PACK_INT64(int64))
         return written + 8
 
     def write_uint64(self, uint64, _=None):
         written = self.align(8)
-        self.buffer.extend(pack('<Q', uint64))
+        self.buffer.extend(PACK_UINT64(uint64))
         return written + 8
 
     def write_double(self, double, _=None):
         written = self.align(8)
-        self.buffer.extend(pack('<d', double))
+        self.buffer.extend(PACK_DOUBLE(double))
         return written + 8
 
     def write_signature(self, signature, _=None):
@@ -127,9 +135,7 @@ class Marshaller:
             for value in array:
                 array_len += self.write_single(child_type, value)
 
-        array_len_packed = pack('<I', array_len)
-        for i in range(offset, offset + 4):
-            self.buffer[i] = array_len_packed[i - offset]
+        self.buffer[offset:offset + 4] = PACK_UINT32(array_len)
 
         return written + array_len
 
@@ -153,8 +159,12 @@ class Marshaller:
 
         return self.writers[t](body, type_)
 
-    def marshall(self):
-        self.buffer.clear()
+    def write_body(self):
+        # appends to the buffer, alignment is relative to the start of it
         for i, type_ in enumerate(self.signature_tree.types):
             self.write_single(type_, self.body[i])
+
+    def marshall(self):
+        self.buffer.clear()
+        self.write_body()
         return self.buffer
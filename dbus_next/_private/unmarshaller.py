@@ -18,9 +18,17 @@ import sys
 from struct import Struct
 
 MAX_UNIX_FDS = 16
+READ_AHEAD_SIZE = 65536
+FD_SIZE = array.array("i").itemsize
+# CMSG_LEN() is not available on every platform, fd passing is only
+# negotiated where it is
+if hasattr(socket, 'CMSG_LEN'):
+    UNIX_FDS_CMSG_LENGTH = socket.CMSG_LEN(MAX_UNIX_FDS * FD_SIZE)
+else:
+    UNIX_FDS_CMSG_LENGTH = None
 
 UNPACK_SYMBOL = {LITTLE_ENDIAN: "<", BIG_ENDIAN: ">"}
-UNPACK_LENGTHS = {BIG_ENDIAN: Struct(">III"), LITTLE_ENDIAN: Struct("<III")}
+UNPACK_HEADER = {BIG_ENDIAN: Struct(">BBBBIII"), LITTLE_ENDIAN: Struct("<BBBBIII")}
 IS_BIG_ENDIAN = sys.byteorder == "big"
 IS_LITTLE_ENDIAN = sys.byteorder == "little"
 
@@ -48,9 +56,11 @@ HEADER_MEMBER = HeaderField.MEMBER.name
 HEADER_ERROR_NAME = HeaderField.ERROR_NAME.name
 HEADER_REPLY_SERIAL = HeaderField.REPLY_SERIAL.name
 HEADER_SENDER = HeaderField.SENDER.name
+HEADER_SIGNATURE = HeaderField.SIGNATURE.name
 
+UNPACK_FROM_TYPE = Callable[[memoryview, int], Tuple[Any]]
 READER_TYPE = Dict[str, Tuple[Optional[Callable[["Unmarshaller", SignatureType], Any]],
-                              Optional[str], Optional[int], Optional[Struct], ], ]
+                              Optional[str], Optional[int], Optional[UNPACK_FROM_TYPE], ], ]
 
 
 class MarshallerStreamEndError(Exception):
@@ -89,7 +99,7 @@ class Unmarshaller:
     unpack: Dict[str, Struct]
     readers: READER_TYPE
 
-    def __init__(self, stream: io.BufferedRWPair, sock=None):
+    def __init__(self, stream: io.BufferedRWPair, sock=None, negotiate_unix_fd=True):
         self.unix_fds: List[int] = []
         self.can_cast = False
         self.buf = bytearray()  # Actual buffer
@@ -97,30 +107,53 @@ class Unmarshaller:
         self.offset = 0
         self.stream = stream
         self.sock = sock
+        self.negotiate_unix_fd = negotiate_unix_fd
         self.message = None
         self.readers = None
+        self.unpack = None
         self.body_len: int | None = None
         self.serial: int | None = None
         self.header_len: int | None = None
         self.message_type: MessageType | None = None
         self.flag: MessageFlag | None = None
 
+    def reset(self) -> None:
+        """Reset the unmarshaller so it can be reused for the next message."""
+        # the view must be released before the buffer can be resized
+        self.view = None
+        if self.message is not None:
+            # keep any bytes of the following message that were already read
+            del self.buf[:HEADER_SIGNATURE_SIZE + self.msg_len]
+        else:
+            self.buf.clear()
+        self.offset = 0
+        self.message = None
+        self.message_type = None
+        # the list was handed over to the previous message
+        self.unix_fds = []
+
     def read_sock(self, length: int) -> bytes:
         """reads from the socket, storing any fds sent and handling errors
         from the read itself"""
-        unix_fd_list = array.array("i")
+        if not self.negotiate_unix_fd:
+            try:
+                # read ahead, anything past the current message is kept in
+                # the buffer for the next one (see reset())
+                return self.sock.recv(max(length, READ_AHEAD_SIZE))
+            except BlockingIOError:
+                raise MarshallerStreamEndError()
 
         try:
-            msg, ancdata, *_ = self.sock.recvmsg(
-                length, socket.CMSG_LEN(MAX_UNIX_FDS * unix_fd_list.itemsize))
+            msg, ancdata, *_ = self.sock.recvmsg(length, UNIX_FDS_CMSG_LENGTH)
         except BlockingIOError:
             raise MarshallerStreamEndError()
 
         for level, type_, data in ancdata:
             if not (level == socket.SOL_SOCKET and type_ == socket.SCM_RIGHTS):
                 continue
-            unix_fd_list.frombytes(data[:len(data) - (len(data) % unix_fd_list.itemsize)])
-            self.unix_fds.extend(list(unix_fd_list))
+            # a truncated trailing fd is dropped
+            fd_data = memoryview(data)[:len(data) - (len(data) % FD_SIZE)]
+            self.unix_fds.extend(fd_data.cast("i"))
 
         return msg
 
@@ -139,6 +172,8 @@ class Unmarshaller:
         """
         start_len = len(self.buf)
         missing_bytes = offset - (start_len - self.offset)
+        if missing_bytes <= 0:
+            return
         if self.sock is None:
             data = self.stream.read(missing_bytes)
         else:
@@ -148,11 +183,11 @@ class Unmarshaller:
         if data is None:
             raise MarshallerStreamEndError()
         self.buf.extend(data)
-        if len(data) + start_len != offset:
+        if len(data) + start_len < offset:
             raise MarshallerStreamEndError()
 
     def read_boolean(self, _=None):
-        return bool(self.read_argument(UINT32_SIGNATURE))
+        return self.read_argument(UINT32_SIGNATURE) != 0
 
     def read_string(self, _=None):
         str_length = self.read_argument(UINT32_SIGNATURE)
@@ -186,38 +221,53 @@ class Unmarshaller:
         array_length = self.read_argument(UINT32_SIGNATURE)
 
         child_type = type_.children[0]
-        if child_type.token in "xtd{(":
+        token = child_type.token
+        if token in "xtd{(":
             # the first alignment is not included in the array size
             self.offset += -self.offset & 7  # align 8
 
-        if child_type.token == "y":
+        if token == "y":
             self.offset += array_length
             return self.buf[self.offset - array_length:self.offset]
 
+        reader, ctype, _, _ = self.readers[token]
+        if not reader:
+            # fixed width elements are packed without padding, so the whole
+            # array can be cast or unpacked at once
+            self.offset += array_length
+            array_view = self.view[self.offset - array_length:self.offset]
+            if self.can_cast:
+                return array_view.cast(ctype).tolist()
+            return [value for value, in self.unpack[token].iter_unpack(array_view)]
+
         beginning_offset = self.offset
 
-        if child_type.token == "{":
+        if token == "{":
+            key_type, value_type = child_type.children
             result_dict = {}
             while self.offset - beginning_offset < array_length:
-                key, value = self.read_dict_entry(child_type)
-                result_dict[key] = value
+                # the padding after the last entry is not part of the array,
+                # so each entry is aligned before it is read
+                self.offset += -self.offset & 7  # align 8
+                key = self.read_argument(key_type)
+                result_dict[key] = self.read_argument(value_type)
             return result_dict
 
         result_list = []
         while self.offset - beginning_offset < array_length:
-            result_list.append(self.read_argument(child_type))
+            result_list.append(reader(self, child_type))
         return result_list
 
     def read_argument(self, type_: SignatureType) -> Any:
         """Dispatch to an argument reader or cast/unpack a C type."""
         token = type_.token
-        reader, ctype, size, struct = self.readers[token]
+        reader, ctype, size, unpack_from = self.readers[token]
         if reader:  # complex type
             return reader(self, type_)
         self.offset += size + (-self.offset & (size - 1))  # align
         if self.can_cast:
             return self.view[self.offset - size:self.offset].cast(ctype)[0]
-        return struct.unpack_from(self.view, self.offset - size)[0]
+        return unpack_from(self.view, self.offset - size)[0]
 
     def header_fields(self, header_length):
         """Header fields are always a(yv)."""
@@ -241,25 +291,22 @@ class Unmarshaller:
         # Signature is of the header is
         # BYTE, BYTE, BYTE, BYTE, UINT32, UINT32, ARRAY of STRUCT of (BYTE,VARIANT)
         self.read_to_offset(HEADER_SIGNATURE_SIZE)
-        buffer = self.buf
-        endian = buffer[0]
-        self.message_type = MESSAGE_TYPE_MAP[buffer[1]]
-        self.flag = MESSAGE_FLAG_MAP[buffer[2]]
-        protocol_version = buffer[3]
-
+        endian = self.buf[0]
         if endian != LITTLE_ENDIAN and endian != BIG_ENDIAN:
             raise InvalidMessageError(
-                f"Expecting endianness as the first byte, got {endian} from {buffer}")
+                f"Expecting endianness as the first byte, got {endian} from {self.buf}")
+
+        (_, message_type, flag, protocol_version, self.body_len, self.serial,
+         self.header_len) = UNPACK_HEADER[endian].unpack_from(self.buf, 0)
         if protocol_version != PROTOCOL_VERSION:
             raise InvalidMessageError(f"got unknown protocol version: {protocol_version}")
 
-        self.body_len, self.serial, self.header_len = UNPACK_LENGTHS[endian].unpack_from(buffer, 4)
+        self.message_type = MESSAGE_TYPE_MAP[message_type]
+        self.flag = MESSAGE_FLAG_MAP[flag]
         self.msg_len = (self.header_len + (-self.header_len & 7) + self.body_len)  # align 8
-        if IS_BIG_ENDIAN and endian == BIG_ENDIAN:
-            self.can_cast = True
-        elif IS_LITTLE_ENDIAN and endian == LITTLE_ENDIAN:
-            self.can_cast = True
+        self.can_cast = endian == (BIG_ENDIAN if IS_BIG_ENDIAN else LITTLE_ENDIAN)
         self.readers = self._readers_by_type[endian]
+        self.unpack = self._unpack_by_type[endian]
 
     def _read_body(self):
         """Read the body of the message."""
@@ -268,7 +315,7 @@ class Unmarshaller:
         self.offset = HEADER_ARRAY_OF_STRUCT_SIGNATURE_POSITION
         header_fields = self.header_fields(self.header_len)
         self.offset += -self.offset & 7  # align 8
-        tree = SignatureTree._get(header_fields.get(HeaderField.SIGNATURE.name, ""))
+        tree = SignatureTree._get(header_fields.get(HEADER_SIGNATURE, ""))
         self.message = Message(
             destination=header_fields.get(HEADER_DESTINATION),
             path=header_fields.get(HEADER_PATH),
@@ -312,16 +359,24 @@ class Unmarshaller:
                                           "v": (read_variant, None, None, None),
                                       }
 
-    _ctype_by_endian: Dict[int, Dict[str, Tuple[None, str, int, Struct]]] = {
+    _unpack_by_type: Dict[int, Dict[str, Struct]] = {
+        endian: {
+            dbus_type: Struct(f"{UNPACK_SYMBOL[endian]}{ctype_size[0]}")
+            for dbus_type, ctype_size in DBUS_TO_CTYPE.items()
+        }
+        for endian in (BIG_ENDIAN, LITTLE_ENDIAN)
+    }
+
+    _ctype_by_endian: Dict[int, Dict[str, Tuple[None, str, int, UNPACK_FROM_TYPE]]] = {
         endian: {
             dbus_type: (
                 None,
-                *ctype_size,
-                Struct(f"{UNPACK_SYMBOL[endian]}{ctype_size[0]}"),
+                *DBUS_TO_CTYPE[dbus_type],
+                struct.unpack_from,
             )
-            for dbus_type, ctype_size in DBUS_TO_CTYPE.items()
+            for dbus_type, struct in unpack.items()
         }
-        for endian in (BIG_ENDIAN, LITTLE_ENDIAN)
+        for endian, unpack in _unpack_by_type.items()
     }
 
     _readers_by_type: Dict[int, READER_TYPE] = {
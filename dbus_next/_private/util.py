@@ -57,6 +57,10 @@ def replace_fds_with_idx(signature: Union[str, SignatureTree],
     if not signature_contains_type(signature, body, 'h'):
         return body, []
 
+    if type(body) is tuple:
+        # the fds are replaced in place
+        body = list(body)
+
     unix_fds = []
 
     def _replace(fd):
@@ -11,11 +11,16 @@ from ..auth import Authenticator, AuthExternal
 import logging
 import array
 import asyncio
-from asyncio import Queue
 import socket
+from collections import deque
 from copy import copy
+from functools import partial
 from typing import Optional
 
+MAX_WRITE_BATCH_SIZE = 65536
+# stays well below IOV_MAX
+MAX_WRITE_BATCH_BUFFERS = 64
+
 
 def _future_set_exception(fut, exc):
     if fut is not None and not fut.done():
@@ -27,54 +32,90 @@ def _future_set_result(fut, result):
         fut.set_result(result)
 
 
+def _future_set_reply(fut, reply, err):
+    if err:
+        _future_set_exception(fut, err)
+    else:
+        _future_set_result(fut, reply)
+
+
 class _MessageWriter:
     def __init__(self, bus):
-        self.messages = Queue()
+        self.messages = deque()
         self.negotiate_unix_fd = bus._negotiate_unix_fd
         self.bus = bus
         self.sock = bus._sock
         self.loop = bus._loop
-        self.buf = None
+        self.buffers = []
         self.fd = bus._fd
-        self.offset = 0
         self.unix_fds = None
-        self.fut = None
+        self.futures = []
+
+    def _next_buffers(self):
+        buf, unix_fds, fut = self.messages.popleft()
+        self.buffers = [memoryview(buf)]
+        self.futures = [fut]
+        if not (unix_fds and self.negotiate_unix_fd):
+            # send the messages queued behind this one with the same
+            # sendmsg() call. messages with unix fds are always sent on their
+            # own.
+            size = len(buf)
+            while self.messages and size < MAX_WRITE_BATCH_SIZE:
+                if len(self.buffers) == MAX_WRITE_BATCH_BUFFERS:
+                    break
+                if self.messages[0][1] and self.negotiate_unix_fd:
+                    break
+                buf, _, fut = self.messages.popleft()
+                self.buffers.append(memoryview(buf))
+                self.futures.append(fut)
+                size += len(buf)
+        self.unix_fds = unix_fds
+
+    def _consume(self, sent):
+        for i, buf in enumerate(self.buffers):
+            if sent < len(buf):
+                self.buffers = self.buffers[i:]
+                self.buffers[0] = buf[sent:]
+                return
+            sent -= len(buf)
+        self.buffers = []
 
     def write_callback(self):
         try:
             while True:
-                if self.buf is None:
-                    if self.messages.qsize() == 0:
+                if not self.buffers:
+                    if not self.messages:
                         # nothing more to write
                         self.loop.remove_writer(self.fd)
                         return
-                    buf, unix_fds, fut = self.messages.get_nowait()
-                    self.unix_fds = unix_fds
-                    self.buf = memoryview(buf)
-                    self.offset = 0
-                    self.fut = fut
-
-                if self.unix_fds and self.negotiate_unix_fd:
-                    ancdata = [(socket.SOL_SOCKET, socket.SCM_RIGHTS,
-                                array.array("i", self.unix_fds))]
-                    self.offset += self.sock.sendmsg([self.buf[self.offset:]], ancdata)
-                    self.unix_fds = None
-                else:
-                    self.offset += self.sock.send(self.buf[self.offset:])
+                    self._next_buffers()
+
+                try:
+                    if self.unix_fds and self.negotiate_unix_fd:
+                        ancdata = [(socket.SOL_SOCKET, socket.SCM_RIGHTS,
+                                    array.array("i", self.unix_fds))]
+                        self._consume(self.sock.sendmsg(self.buffers, ancdata))
+                        self.unix_fds = None
+                    else:
+                        self._consume(self.sock.sendmsg(self.buffers))
+                except BlockingIOError:
+                    # nothing was sent, wait for writable
+                    return
 
-                if self.offset >= len(self.buf):
+                if not self.buffers:
                     # finished writing
-                    self.buf = None
-                    _future_set_result(self.fut, None)
+                    for fut in self.futures:
+                        _future_set_result(fut, None)
                 else:
                     # wait for writable
                     return
         except Exception as e:
-            _future_set_exception(self.fut, e)
+            for fut in self.futures:
+                _future_set_exception(fut, e)
             self.bus._finalize(e)
 
     def buffer_message(self, msg: Message, future=None):
-        self.messages.put_nowait(
+        self.messages.append(
             (msg._marshall(negotiate_unix_fd=self.negotiate_unix_fd), copy(msg.unix_fds), future))
 
     def schedule_write(self, msg: Message = None, future=None):
@@ -123,6 +164,7 @@ class MessageBus(BaseMessageBus):
         self._negotiate_unix_fd = negotiate_unix_fd
         self._loop = asyncio.get_event_loop()
         self._unmarshaller = self._create_unmarshaller()
+        self._auth_buf = bytearray()
 
         self._writer = _MessageWriter(self)
 
@@ -146,7 +188,7 @@ class MessageBus(BaseMessageBus):
               the DBus daemon failed.
             - :class:`Exception` - If there was a connection error.
         """
-        await self._authenticate()
+        begin = await self._authenticate()
 
         future = self._loop.create_future()
 
@@ -171,8 +213,7 @@ class MessageBus(BaseMessageBus):
                             serial=self.next_serial())
 
         self._method_return_handlers[hello_msg.serial] = on_hello
-        self._stream.write(hello_msg._marshall())
-        self._stream.flush()
+        await self._loop.sock_sendall(self._sock, begin + hello_msg._marshall())
 
         return await future
 
@@ -205,13 +246,7 @@ class MessageBus(BaseMessageBus):
         """
         future = self._loop.create_future()
 
-        def reply_handler(reply, err):
-            if err:
-                _future_set_exception(future, err)
-            else:
-                _future_set_result(future, reply)
-
-        super().introspect(bus_name, path, reply_handler)
+        super().introspect(bus_name, path, partial(_future_set_reply, future))
 
         return await asyncio.wait_for(future, timeout=timeout)
 
@@ -235,13 +270,7 @@ class MessageBus(BaseMessageBus):
         """
         future = self._loop.create_future()
 
-        def reply_handler(reply, err):
-            if err:
-                _future_set_exception(future, err)
-            else:
-                _future_set_result(future, reply)
-
-        super().request_name(name, flags, reply_handler)
+        super().request_name(name, flags, partial(_future_set_reply, future))
 
         return await future
 
@@ -263,13 +292,7 @@ class MessageBus(BaseMessageBus):
         """
         future = self._loop.create_future()
 
-        def reply_handler(reply, err):
-            if err:
-                _future_set_exception(future, err)
-            else:
-                _future_set_result(future, reply)
-
-        super().release_name(name, reply_handler)
+        super().release_name(name, partial(_future_set_reply, future))
 
         return await future
 
@@ -293,14 +316,7 @@ class MessageBus(BaseMessageBus):
 
         future = self._loop.create_future()
 
-        def reply_handler(reply, err):
-            if not future.done():
-                if err:
-                    _future_set_exception(future, err)
-                else:
-                    _future_set_result(future, reply)
-
-        self._call(msg, reply_handler)
+        self._call(msg, partial(_future_set_reply, future))
 
         await future
 
@@ -364,41 +380,48 @@ class MessageBus(BaseMessageBus):
             while True:
                 if self._unmarshaller.unmarshall():
                     self._on_message(self._unmarshaller.message)
-                    self._unmarshaller = self._create_unmarshaller()
+                    self._unmarshaller.reset()
                 else:
                     break
         except Exception as e:
             self._finalize(e)
 
     async def _auth_readline(self):
-        buf = b''
-        while buf[-2:] != b'\r\n':
-            buf += await self._loop.sock_recv(self._sock, 2)
-        return buf[:-2].decode()
+        while True:
+            line_end = self._auth_buf.find(b'\r\n')
+            if line_end != -1:
+                line = self._auth_buf[:line_end].decode()
+                del self._auth_buf[:line_end + 2]
+                return line
+            data = await self._loop.sock_recv(self._sock, 4096)
+            if not data:
+                raise EOFError()
+            self._auth_buf.extend(data)
 
     async def _authenticate(self):
-        await self._loop.sock_sendall(self._sock, b'\0')
-
         first_line = self._auth._authentication_start(negotiate_unix_fd=self._negotiate_unix_fd)
 
+        # the nul byte goes out in the same write as the first auth command
+        auth_start = b'\0'
         if first_line is not None:
             if type(first_line) is not str:
                 raise AuthError('authenticator gave response not type str')
-            await self._loop.sock_sendall(self._sock, Authenticator._format_line(first_line))
+            auth_start += Authenticator._format_line(first_line)
+        await self._loop.sock_sendall(self._sock, auth_start)
 
         while True:
             response = self._auth._receive_line(await self._auth_readline())
+            if response == 'BEGIN':
+                # anything read past the last line belongs to the first message
+                self._unmarshaller.buf.extend(self._auth_buf)
+                self._auth_buf.clear()
+                # BEGIN is sent by the caller in the same write as the Hello message
+                return Authenticator._format_line(response)
             if response is not None:
                 await self._loop.sock_sendall(self._sock, Authenticator._format_line(response))
-                self._stream.flush()
-            if response == 'BEGIN':
-                break
 
     def _create_unmarshaller(self):
-        sock = None
-        if self._negotiate_unix_fd:
-            sock = self._sock
-        return Unmarshaller(self._stream, sock)
+        return Unmarshaller(None, self._sock, self._negotiate_unix_fd)
 
     def _finalize(self, err=None):
         try:
@@ -8,9 +8,76 @@ from .._private.util import replace_idx_with_fds, replace_fds_with_idx
 from .. import introspection as intr
 import xml.etree.ElementTree as ET
 
+from functools import partial
 from typing import Union, List
 
 
+async def _call_method(interface, intr_method, *args, flags=MessageFlag.NONE):
+    input_body, unix_fds = replace_fds_with_idx(intr_method.in_signature, args)
+
+    msg = await interface.bus.call(
+        Message(destination=interface.bus_name,
+                path=interface.path,
+                interface=interface.introspection.name,
+                member=intr_method.name,
+                signature=intr_method.in_signature,
+                body=input_body,
+                flags=flags,
+                unix_fds=unix_fds))
+
+    if flags & MessageFlag.NO_REPLY_EXPECTED:
+        return None
+
+    BaseProxyInterface._check_method_return(msg, intr_method.out_signature)
+
+    out_len = len(intr_method.out_args)
+
+    body = replace_idx_with_fds(msg.signature_tree, msg.body, msg.unix_fds)
+
+    if not out_len:
+        return None
+    elif out_len == 1:
+        return body[0]
+    else:
+        return body
+
+
+async def _get_property(interface, intr_property):
+    msg = await interface.bus.call(
+        Message(destination=interface.bus_name,
+                path=interface.path,
+                interface='org.freedesktop.DBus.Properties',
+                member='Get',
+                signature='ss',
+                body=[interface.introspection.name, intr_property.name]))
+
+    BaseProxyInterface._check_method_return(msg, 'v')
+    variant = msg.body[0]
+    if variant.signature != intr_property.signature:
+        raise DBusError(ErrorType.CLIENT_ERROR,
+                        f'property returned unexpected signature "{variant.signature}"', msg)
+
+    return replace_idx_with_fds('v', msg.body, msg.unix_fds)[0].value
+
+
+async def _set_property(interface, intr_property, val):
+    variant = Variant(intr_property.signature, val)
+
+    body, unix_fds = replace_fds_with_idx(
+        'ssv', [interface.introspection.name, intr_property.name, variant])
+
+    msg = await interface.bus.call(
+        Message(destination=interface.bus_name,
+                path=interface.path,
+                interface='org.freedesktop.DBus.Properties',
+                member='Set',
+                signature='ssv',
+                body=body,
+                unix_fds=unix_fds))
+
+    BaseProxyInterface._check_method_return(msg)
+
+
 class ProxyInterface(BaseProxyInterface):
     """A class representing a proxy to an interface exported on the bus by
     another client for the asyncio :class:`MessageBus
@@ -73,77 +140,13 @@ class ProxyInterface(BaseProxyInterface):
     <dbus_next.DBusError>` will be raised with information about the error.
     """
     def _add_method(self, intr_method):
-        async def method_fn(*args, flags=MessageFlag.NONE):
-            input_body, unix_fds = replace_fds_with_idx(intr_method.in_signature, list(args))
-
-            msg = await self.bus.call(
-                Message(destination=self.bus_name,
-                        path=self.path,
-                        interface=self.introspection.name,
-                        member=intr_method.name,
-                        signature=intr_method.in_signature,
-                        body=input_body,
-                        flags=flags,
-                        unix_fds=unix_fds))
-
-            if flags & MessageFlag.NO_REPLY_EXPECTED:
-                return None
-
-            BaseProxyInterface._check_method_return(msg, intr_method.out_signature)
-
-            out_len = len(intr_method.out_args)
-
-            body = replace_idx_with_fds(msg.signature_tree, msg.body, msg.unix_fds)
-
-            if not out_len:
-                return None
-            elif out_len == 1:
-                return body[0]
-            else:
-                return body
-
         method_name = f'call_{BaseProxyInterface._to_snake_case(intr_method.name)}'
-        setattr(self, method_name, method_fn)
+        setattr(self, method_name, partial(_call_method, self, intr_method))
 
     def _add_property(self, intr_property):
-        async def property_getter():
-            msg = await self.bus.call(
-                Message(destination=self.bus_name,
-                        path=self.path,
-                        interface='org.freedesktop.DBus.Properties',
-                        member='Get',
-                        signature='ss',
-                        body=[self.introspection.name, intr_property.name]))
-
-            BaseProxyInterface._check_method_return(msg, 'v')
-            variant = msg.body[0]
-            if variant.signature != intr_property.signature:
-                raise DBusError(ErrorType.CLIENT_ERROR,
-                                f'property returned unexpected signature "{variant.signature}"',
-                                msg)
-
-            return replace_idx_with_fds('v', msg.body, msg.unix_fds)[0].value
-
-        async def property_setter(val):
-            variant = Variant(intr_property.signature, val)
-
-            body, unix_fds = replace_fds_with_idx(
-                'ssv', [self.introspection.name, intr_property.name, variant])
-
-            msg = await self.bus.call(
-                Message(destination=self.bus_name,
-                        path=self.path,
-                        interface='org.freedesktop.DBus.Properties',
-                        member='Set',
-                        signature='ssv',
-                        body=body,
-                        unix_fds=unix_fds))
-
-            BaseProxyInterface._check_method_return(msg)
-
         snake_case = BaseProxyInterface._to_snake_case(intr_property.name)
-        setattr(self, f'get_{snake_case}', property_getter)
-        setattr(self, f'set_{snake_case}', property_setter)
+        setattr(self, f'get_{snake_case}', partial(_get_property, self, intr_property))
+        setattr(self, f'set_{snake_case}', partial(_set_property, self, intr_property))
 
 
 class ProxyObject(BaseProxyObject):
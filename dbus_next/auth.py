@@ -1,4 +1,5 @@
 from .errors import AuthError
+from functools import lru_cache
 import enum
 import os
 
@@ -27,6 +28,12 @@ class _AuthResponse(enum.Enum):
         return response, args[1:]
 
 
+@lru_cache(maxsize=4)
+def _auth_external_line(uid):
+    hex_uid = str(uid).encode().hex()
+    return f'AUTH EXTERNAL {hex_uid}'
+
+
 # UNSTABLE
 class Authenticator:
     """The base class for authenticators for :class:`MessageBus <dbus_next.message_bus.BaseMessageBus>` authentication.
@@ -59,8 +66,7 @@ class AuthExternal(Authenticator):
 
     def _authentication_start(self, negotiate_unix_fd=False) -> str:
         self.negotiate_unix_fd = negotiate_unix_fd
-        hex_uid = str(os.getuid()).encode().hex()
-        return f'AUTH EXTERNAL {hex_uid}'
+        return _auth_external_line(os.getuid())
 
     def _receive_line(self, line: str):
         response, args = _AuthResponse.parse(line)
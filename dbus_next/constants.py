@@ -29,7 +29,8 @@ class MessageFlag(IntFlag):
     ALLOW_INTERACTIVE_AUTHORIZATION = 4
 
 
-MESSAGE_FLAG_MAP = {field.value: field for field in MessageFlag}
+# every combination of the flags, iterating the enum only gives the members
+MESSAGE_FLAG_MAP = {value: MessageFlag(value) for value in range(8)}
 
 
 class NameFlag(IntFlag):
@@ -72,7 +72,7 @@ class DBusError(Exception):
 
     @staticmethod
     def _from_message(msg):
-        assert msg.message_type == MessageType.ERROR
+        assert msg.message_type is MessageType.ERROR
         return DBusError(msg.error_name, msg.body[0], reply=msg)
 
     def _as_message(self, msg):
@@ -8,7 +8,6 @@ from .proxy_object import ProxyObject
 from .. import introspection as intr
 from ..auth import Authenticator, AuthExternal
 
-import io
 from typing import Callable, Optional
 
 # glib is optional
@@ -25,7 +24,7 @@ except ImportError as e:
 
 class _MessageSource(_GLibSource):
     def __init__(self, bus):
-        self.unmarshaller = None
+        self.unmarshaller = Unmarshaller(bus._stream)
         self.bus = bus
 
     def prepare(self):
@@ -37,12 +36,9 @@ class _MessageSource(_GLibSource):
     def dispatch(self, callback, user_data):
         try:
             while self.bus._stream.readable():
-                if not self.unmarshaller:
-                    self.unmarshaller = Unmarshaller(self.bus._stream)
-
                 if self.unmarshaller.unmarshall():
                     callback(self.unmarshaller.message)
-                    self.unmarshaller = None
+                    self.unmarshaller.reset()
                 else:
                     break
         except Exception as e:
@@ -56,9 +52,7 @@ class _MessageSource(_GLibSource):
 class _MessageWritableSource(_GLibSource):
     def __init__(self, bus):
         self.bus = bus
-        self.buf = b''
-        self.message_stream = None
-        self.chunk_size = 128
+        self.buf = None
 
     def prepare(self):
         return (False, -1)
@@ -68,29 +62,27 @@ class _MessageWritableSource(_GLibSource):
 
     def dispatch(self, callback, user_data):
         try:
-            if self.buf:
-                self.bus._stream.write(self.buf)
-                self.buf = b''
-
-            if self.message_stream:
-                while True:
-                    self.buf = self.message_stream.read(self.chunk_size)
-                    if self.buf == b'':
-                        break
-                    self.bus._stream.write(self.buf)
-                    if len(self.buf) < self.chunk_size:
-                        self.buf = b''
-                        break
-                    self.buf = b''
-
+            # anything still buffered in the stream must go out first
             self.bus._stream.flush()
 
-            if not self.bus._buffered_messages:
-                return GLib.SOURCE_REMOVE
-            else:
-                message = self.bus._buffered_messages.pop(0)
-                self.message_stream = io.BytesIO(message._marshall())
-                return GLib.SOURCE_CONTINUE
+            while True:
+                if self.buf is None:
+                    if not self.bus._buffered_messages:
+                        return GLib.SOURCE_REMOVE
+                    # send everything queued so far with one call
+                    buf = bytearray()
+                    for message in self.bus._buffered_messages:
+                        buf.extend(message._marshall())
+                    self.bus._buffered_messages.clear()
+                    self.buf = memoryview(buf)
+
+                sent = self.bus._sock.send(self.buf)
+                if sent < len(self.buf):
+                    # short write, continue where we left off when the socket is writable
+                    self.buf = self.buf[sent:]
+                    return GLib.SOURCE_CONTINUE
+
+                self.buf = None
         except BlockingIOError:
             return GLib.SOURCE_CONTINUE
         except Exception as e:
@@ -101,7 +93,7 @@ class _MessageWritableSource(_GLibSource):
 class _AuthLineSource(_GLibSource):
     def __init__(self, stream):
         self.stream = stream
-        self.buf = b''
+        self.buf = bytearray()
 
     def prepare(self):
         return (False, -1)
@@ -110,13 +102,19 @@ class _AuthLineSource(_GLibSource):
         return False
 
     def dispatch(self, callback, user_data):
-        self.buf += self.stream.read()
-        if self.buf[-2:] == b'\r\n':
-            resp = callback(self.buf.decode()[:-2])
-            if resp:
-                return GLib.SOURCE_REMOVE
+        data = self.stream.read()
+        if data:
+            self.buf.extend(data)
 
-        return GLib.SOURCE_CONTINUE
+        while True:
+            end = self.buf.find(b'\r\n')
+            if end == -1:
+                return GLib.SOURCE_CONTINUE
+
+            line = self.buf[:end].decode()
+            del self.buf[:end + 2]
+            if callback(line):
+                return GLib.SOURCE_REMOVE
 
 
 class MessageBus(BaseMessageBus):
@@ -154,6 +152,7 @@ class MessageBus(BaseMessageBus):
             raise _import_error
 
         super().__init__(bus_address, bus_type, ProxyObject)
+        self._stream = self._sock.makefile('rwb')
         self._main_context = GLib.main_context_default()
         # buffer messages until connect
         self._buffered_messages = []
@@ -195,8 +194,8 @@ class MessageBus(BaseMessageBus):
 
                 self.unique_name = reply.body[0]
 
-                for m in self._buffered_messages:
-                    self.send(m)
+                if self._buffered_messages:
+                    self._schedule_write()
 
                 if connect_notify:
                     connect_notify(self, err)
@@ -455,11 +454,12 @@ class MessageBus(BaseMessageBus):
             try:
                 resp = self._auth._receive_line(line)
                 self._stream.write(Authenticator._format_line(resp))
-                self._stream.flush()
                 if resp == 'BEGIN':
+                    # BEGIN is flushed together with the Hello message
                     self._readline_source.destroy()
                     authenticate_notify(None)
                     return True
+                self._stream.flush()
             except Exception as e:
                 authenticate_notify(e)
                 return True
@@ -7,6 +7,7 @@ from ..constants import ErrorType
 from .. import introspection as intr
 import xml.etree.ElementTree as ET
 
+from functools import partial
 from typing import Union, List
 
 # glib is optional
@@ -16,6 +17,53 @@ except ImportError:
     pass
 
 
+def _method_call_notify(intr_method, callback, msg, err):
+    if err:
+        callback([], err)
+        return
+
+    try:
+        BaseProxyInterface._check_method_return(msg, intr_method.out_signature)
+    except DBusError as e:
+        err = e
+
+    callback(msg.body, err)
+
+
+def _property_get_notify(intr_property, callback, msg, err):
+    if err:
+        callback(None, err)
+        return
+
+    try:
+        BaseProxyInterface._check_method_return(msg)
+    except Exception as e:
+        callback(None, e)
+        return
+
+    variant = msg.body[0]
+    if variant.signature != intr_property.signature:
+        err = DBusError(ErrorType.CLIENT_ERROR,
+                        f'property returned unexpected signature "{variant.signature}"', msg)
+        callback(None, err)
+        return
+
+    callback(variant.value, None)
+
+
+def _property_set_notify(callback, msg, err):
+    if err:
+        callback(None, err)
+        return
+    try:
+        BaseProxyInterface._check_method_return(msg)
+    except Exception as e:
+        callback(None, e)
+        return
+
+    return callback(None, None)
+
+
 class ProxyInterface(BaseProxyInterface):
     """A class representing a proxy to an interface exported on the bus by
     another client for the GLib :class:`MessageBus <dbus_next.glib.MessageBus>`
@@ -118,22 +166,9 @@ class ProxyInterface(BaseProxyInterface):
                     f'method {intr_method.name} expects {in_len} arguments and a callback (got {len(args)} args)'
                 )
 
-            args = list(args)
             # TODO type check: this callback takes two parameters
             # (MessageBus.check_callback(cb))
-            callback = args.pop()
-
-            def call_notify(msg, err):
-                if err:
-                    callback([], err)
-                    return
-
-                try:
-                    BaseProxyInterface._check_method_return(msg, intr_method.out_signature)
-                except DBusError as e:
-                    err = e
-
-                callback(msg.body, err)
+            *body, callback = args
 
             self.bus.call(
                 Message(destination=self.bus_name,
@@ -141,7 +176,7 @@ class ProxyInterface(BaseProxyInterface):
                         interface=self.introspection.name,
                         member=intr_method.name,
                         signature=intr_method.in_signature,
-                        body=list(args)), call_notify)
+                        body=body), partial(_method_call_notify, intr_method, callback))
 
         def method_fn_sync(*args):
             main = GLib.MainLoop()
@@ -177,34 +212,14 @@ class ProxyInterface(BaseProxyInterface):
 
     def _add_property(self, intr_property):
         def property_getter(callback):
-            def call_notify(msg, err):
-                if err:
-                    callback(None, err)
-                    return
-
-                try:
-                    BaseProxyInterface._check_method_return(msg)
-                except Exception as e:
-                    callback(None, e)
-                    return
-
-                variant = msg.body[0]
-                if variant.signature != intr_property.signature:
-                    err = DBusError(ErrorType.CLIENT_ERROR,
-                                    'property returned unexpected signature "{variant.signature}"',
-                                    msg)
-                    callback(None, err)
-                    return
-
-                callback(variant.value, None)
-
             self.bus.call(
                 Message(destination=self.bus_name,
                         path=self.path,
                         interface='org.freedesktop.DBus.Properties',
                         member='Get',
                         signature='ss',
-                        body=[self.introspection.name, intr_property.name]), call_notify)
+                        body=[self.introspection.name, intr_property.name]),
+                partial(_property_get_notify, intr_property, callback))
 
         def property_getter_sync():
             property_value = None
@@ -226,18 +241,6 @@ class ProxyInterface(BaseProxyInterface):
             return property_value
 
         def property_setter(value, callback):
-            def call_notify(msg, err):
-                if err:
-                    callback(None, err)
-                    return
-                try:
-                    BaseProxyInterface._check_method_return(msg)
-                except Exception as e:
-                    callback(None, e)
-                    return
-
-                return callback(None, None)
-
             variant = Variant(intr_property.signature, value)
             self.bus.call(
                 Message(destination=self.bus_name,
@@ -245,7 +248,8 @@ class ProxyInterface(BaseProxyInterface):
                         interface='org.freedesktop.DBus.Properties',
                         member='Set',
                         signature='ssv',
-                        body=[self.introspection.name, intr_property.name, variant]), call_notify)
+                        body=[self.introspection.name, intr_property.name, variant]),
+                partial(_property_set_notify, callback))
 
         def property_setter_sync(val):
             reply_error = None
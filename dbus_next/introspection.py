@@ -3,9 +3,32 @@ from .signature import SignatureTree, SignatureType
 from .validators import assert_member_name_valid, assert_interface_name_valid
 from .errors import InvalidIntrospectionError
 
-from typing import List, Union
+from functools import lru_cache
+from typing import List, Tuple, Union
 
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+# entities ElementTree escapes in attribute values besides &, < and >
+_XML_ATTR_ENTITIES = {'"': '&quot;', '\r': '&#13;', '\n': '&#10;', '\t': '&#09;'}
+
+
+def _write_xml_element(out: List[str], start: str, tag: str, children: list, indent: str):
+    # writes the same markup and whitespace that Node.tostring() produced by
+    # indenting the ElementTree from to_xml() and serializing it
+    if not children:
+        out.append(f'{start} />')
+        return
+
+    out.append(f'{start}>')
+    child_indent = indent + '    '
+    separator = indent + '  '
+    for child in children:
+        out.append(separator)
+        child._write_xml(out, child_indent)
+        separator = child_indent
+    out.append(f'{indent}</{tag}>')
+
 
 # https://dbus.freedesktop.org/doc/dbus-specification.html#introspection-format
 # TODO annotations
@@ -28,6 +51,8 @@ class Arg:
         - :class:`InvalidSignatureError <dbus_next.InvalidSignatureError>` - If the signature is not valid.
         - :class:`InvalidIntrospectionError <dbus_next.InvalidIntrospectionError>` - If the signature is not a single complete type.
     """
+    __slots__ = ('type', 'signature', 'name', 'direction')
+
     def __init__(self,
                  signature: Union[SignatureType, str],
                  direction: List[ArgDirection] = None,
@@ -86,6 +111,14 @@ class Arg:
 
         return element
 
+    def _write_xml(self, out: List[str], indent: str):
+        start = '<arg'
+        if self.name:
+            start += f' name="{self.name}"'
+        if self.direction:
+            start += f' direction="{self.direction.value}"'
+        out.append(f'{start} type="{self.signature}" />')
+
 
 class Signal:
     """A class that represents a signal exposed on an interface.
@@ -100,6 +133,8 @@ class Signal:
     :raises:
         - :class:`InvalidMemberNameError <dbus_next.InvalidMemberNameError>` - If the name of the signal is not a valid member name.
     """
+    __slots__ = ('name', 'args', 'signature')
+
     def __init__(self, name: str, args: List[Arg] = None):
         if name is not None:
             assert_member_name_valid(name)
@@ -145,6 +180,9 @@ class Signal:
 
         return element
 
+    def _write_xml(self, out: List[str], indent: str):
+        _write_xml_element(out, f'<signal name="{self.name}"', 'signal', self.args, indent)
+
 
 class Method:
     """A class that represents a method exposed on an :class:`Interface`.
@@ -163,14 +201,16 @@ class Method:
     :raises:
         - :class:`InvalidMemberNameError <dbus_next.InvalidMemberNameError>` - If the name of this method is not valid.
     """
-    def __init__(self, name: str, in_args: List[Arg] = [], out_args: List[Arg] = []):
+    __slots__ = ('name', 'in_args', 'out_args', 'in_signature', 'out_signature')
+
+    def __init__(self, name: str, in_args: List[Arg] = None, out_args: List[Arg] = None):
         assert_member_name_valid(name)
 
         self.name = name
-        self.in_args = in_args
-        self.out_args = out_args
-        self.in_signature = ''.join(arg.signature for arg in in_args)
-        self.out_signature = ''.join(arg.signature for arg in out_args)
+        self.in_args = in_args if in_args is not None else []
+        self.out_args = out_args if out_args is not None else []
+        self.in_signature = ''.join(arg.signature for arg in self.in_args)
+        self.out_signature = ''.join(arg.signature for arg in self.out_args)
 
     def from_xml(element: ET.Element) -> 'Method':
         """Convert an :class:`xml.etree.ElementTree.Element` to a :class:`Method`.
@@ -216,6 +256,10 @@ class Method:
 
         return element
 
+    def _write_xml(self, out: List[str], indent: str):
+        _write_xml_element(out, f'<method name="{self.name}"', 'method',
+                           self.in_args + self.out_args, indent)
+
 
 class Property:
     """A class that represents a DBus property exposed on an
@@ -235,6 +279,8 @@ class Property:
         - :class `InvalidSignatureError <dbus_next.InvalidSignatureError>` - If the given signature is not valid.
         - :class: `InvalidMemberNameError <dbus_next.InvalidMemberNameError>` - If the member name is not valid.
     """
+    __slots__ = ('name', 'signature', 'access', 'type')
+
     def __init__(self,
                  name: str,
                  signature: str,
@@ -282,6 +328,10 @@ class Property:
         element.set('access', self.access.value)
         return element
 
+    def _write_xml(self, out: List[str], indent: str):
+        out.append(
+            f'<property name="{self.name}" type="{self.signature}" access="{self.access.value}" />')
+
 
 class Interface:
     """A class that represents a DBus interface exported on on object path.
@@ -301,6 +351,8 @@ class Interface:
     :raises:
         - :class:`InvalidInterfaceNameError <dbus_next.InvalidInterfaceNameError>` - If the name is not a valid interface name.
     """
+    __slots__ = ('name', 'methods', 'signals', 'properties')
+
     def __init__(self,
                  name: str,
                  methods: List[Method] = None,
@@ -357,6 +409,10 @@ class Interface:
 
         return element
 
+    def _write_xml(self, out: List[str], indent: str):
+        _write_xml_element(out, f'<interface name="{self.name}"', 'interface',
+                           self.methods + self.signals + self.properties, indent)
+
 
 class Node:
     """A class that represents a node in an object path in introspection data.
@@ -384,6 +440,8 @@ class Node:
     :raises:
         - :class:`InvalidIntrospectionError <dbus_next.InvalidIntrospectionError>` - If the name is not a valid node name.
     """
+    __slots__ = ('interfaces', 'nodes', 'name', 'is_root')
+
     def __init__(self, name: str = None, interfaces: List[Interface] = None, is_root: bool = True):
         if not is_root and not name:
             raise InvalidIntrospectionError('child nodes must have a "name" attribute')
@@ -451,29 +509,21 @@ class Node:
 
         return element
 
+    def _write_xml(self, out: List[str], indent: str):
+        start = '<node'
+        if self.name:
+            # node names are the only attribute values that are not validated
+            start += f' name="{escape(self.name, _XML_ATTR_ENTITIES)}"'
+        _write_xml_element(out, start, 'node', self.interfaces + self.nodes, indent)
+
     def tostring(self) -> str:
         """Convert this :class:`Node` into a DBus introspection XML string.
         """
         header = '<!DOCTYPE node PUBLIC "-//freedesktop//DTD D-BUS Object Introspection 1.0//EN"\n"http://www.freedesktop.org/standards/dbus/1.0/introspect.dtd">\n'
 
-        def indent(elem, level=0):
-            i = "\n" + level * "    "
-            if len(elem):
-                if not elem.text or not elem.text.strip():
-                    elem.text = i + "  "
-                if not elem.tail or not elem.tail.strip():
-                    elem.tail = i
-                for elem in elem:
-                    indent(elem, level + 1)
-                if not elem.tail or not elem.tail.strip():
-                    elem.tail = i
-            else:
-                if level and (not elem.tail or not elem.tail.strip()):
-                    elem.tail = i
-
-        xml = self.to_xml()
-        indent(xml)
-        return header + ET.tostring(xml, encoding='unicode').rstrip()
+        out = [header]
+        self._write_xml(out, '\n')
+        return ''.join(out)
 
     @staticmethod
     def default(name: str = None) -> 'Node':
@@ -486,67 +536,72 @@ class Node:
         * ``org.freedesktop.DBus.Properties``
         * ``org.freedesktop.DBus.ObjectManager``
         """
-        return Node(name,
-                    is_root=True,
-                    interfaces=[
-                        Interface('org.freedesktop.DBus.Introspectable',
-                                  methods=[
-                                      Method('Introspect',
-                                             out_args=[Arg('s', ArgDirection.OUT, 'data')])
-                                  ]),
-                        Interface('org.freedesktop.DBus.Peer',
-                                  methods=[
-                                      Method('GetMachineId',
-                                             out_args=[Arg('s', ArgDirection.OUT, 'machine_uuid')]),
-                                      Method('Ping')
-                                  ]),
-                        Interface('org.freedesktop.DBus.Properties',
-                                  methods=[
-                                      Method('Get',
-                                             in_args=[
-                                                 Arg('s', ArgDirection.IN, 'interface_name'),
-                                                 Arg('s', ArgDirection.IN, 'property_name')
-                                             ],
-                                             out_args=[Arg('v', ArgDirection.OUT, 'value')]),
-                                      Method('Set',
-                                             in_args=[
-                                                 Arg('s', ArgDirection.IN, 'interface_name'),
-                                                 Arg('s', ArgDirection.IN, 'property_name'),
-                                                 Arg('v', ArgDirection.IN, 'value')
-                                             ]),
-                                      Method('GetAll',
-                                             in_args=[Arg('s', ArgDirection.IN, 'interface_name')],
-                                             out_args=[Arg('a{sv}', ArgDirection.OUT, 'props')])
-                                  ],
-                                  signals=[
-                                      Signal('PropertiesChanged',
-                                             args=[
-                                                 Arg('s', ArgDirection.OUT, 'interface_name'),
-                                                 Arg('a{sv}', ArgDirection.OUT,
-                                                     'changed_properties'),
-                                                 Arg('as', ArgDirection.OUT,
-                                                     'invalidated_properties')
-                                             ])
-                                  ]),
-                        Interface('org.freedesktop.DBus.ObjectManager',
-                                  methods=[
-                                      Method('GetManagedObjects',
-                                             out_args=[
-                                                 Arg('a{oa{sa{sv}}}', ArgDirection.OUT,
-                                                     'objpath_interfaces_and_properties')
-                                             ]),
-                                  ],
-                                  signals=[
-                                      Signal('InterfacesAdded',
-                                             args=[
-                                                 Arg('o', ArgDirection.OUT, 'object_path'),
-                                                 Arg('a{sa{sv}}', ArgDirection.OUT,
-                                                     'interfaces_and_properties'),
-                                             ]),
-                                      Signal('InterfacesRemoved',
-                                             args=[
-                                                 Arg('o', ArgDirection.OUT, 'object_path'),
-                                                 Arg('as', ArgDirection.OUT, 'interfaces'),
-                                             ])
-                                  ]),
-                    ])
+        return Node(name, is_root=True, interfaces=Node._default_interfaces())
+
+    @staticmethod
+    def _default_interfaces() -> List[Interface]:
+        return [
+            Interface('org.freedesktop.DBus.Introspectable',
+                      methods=[Method('Introspect', out_args=[Arg('s', ArgDirection.OUT,
+                                                                  'data')])]),
+            Interface('org.freedesktop.DBus.Peer',
+                      methods=[
+                          Method('GetMachineId',
+                                 out_args=[Arg('s', ArgDirection.OUT, 'machine_uuid')]),
+                          Method('Ping')
+                      ]),
+            Interface('org.freedesktop.DBus.Properties',
+                      methods=[
+                          Method('Get',
+                                 in_args=[
+                                     Arg('s', ArgDirection.IN, 'interface_name'),
+                                     Arg('s', ArgDirection.IN, 'property_name')
+                                 ],
+                                 out_args=[Arg('v', ArgDirection.OUT, 'value')]),
+                          Method('Set',
+                                 in_args=[
+                                     Arg('s', ArgDirection.IN, 'interface_name'),
+                                     Arg('s', ArgDirection.IN, 'property_name'),
+                                     Arg('v', ArgDirection.IN, 'value')
+                                 ]),
+                          Method('GetAll',
+                                 in_args=[Arg('s', ArgDirection.IN, 'interface_name')],
+                                 out_args=[Arg('a{sv}', ArgDirection.OUT, 'props')])
+                      ],
+                      signals=[
+                          Signal('PropertiesChanged',
+                                 args=[
+                                     Arg('s', ArgDirection.OUT, 'interface_name'),
+                                     Arg('a{sv}', ArgDirection.OUT, 'changed_properties'),
+                                     Arg('as', ArgDirection.OUT, 'invalidated_properties')
+                                 ])
+                      ]),
+            Interface('org.freedesktop.DBus.ObjectManager',
+                      methods=[
+                          Method('GetManagedObjects',
+                                 out_args=[
+                                     Arg('a{oa{sa{sv}}}', ArgDirection.OUT,
+                                         'objpath_interfaces_and_properties')
+                                 ]),
+                      ],
+                      signals=[
+                          Signal('InterfacesAdded',
+                                 args=[
+                                     Arg('o', ArgDirection.OUT, 'object_path'),
+                                     Arg('a{sa{sv}}', ArgDirection.OUT,
+                                         'interfaces_and_properties'),
+                                 ]),
+                          Signal('InterfacesRemoved',
+                                 args=[
+                                     Arg('o', ArgDirection.OUT, 'object_path'),
+                                     Arg('as', ArgDirection.OUT, 'interfaces'),
+                                 ])
+                      ]),
+        ]
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _shared_default_interfaces() -> Tuple[Interface, ...]:
+        # built once and shared by every node the bus introspects, so these
+        # must not be modified
+        return tuple(Node._default_interfaces())
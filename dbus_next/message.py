@@ -1,12 +1,32 @@
 from ._private.marshaller import Marshaller
-from .constants import MessageType, MessageFlag, ErrorType
+from .constants import MessageType, MessageFlag, ErrorType, MESSAGE_FLAG_MAP
 from ._private.constants import PROTOCOL_VERSION, HeaderField, LITTLE_ENDIAN
 from .validators import assert_bus_name_valid, assert_member_name_valid, assert_object_path_valid, assert_interface_name_valid
 from .errors import InvalidMessageError
 from .signature import SignatureTree, Variant
 
+from struct import Struct
 from typing import List, Any
 
+PACK_HEADER_PREFIX = Struct('<BBBBII').pack
+PACK_UINT32_INTO = Struct('<I').pack_into
+
+HEADER_PATH = HeaderField.PATH.value
+HEADER_INTERFACE = HeaderField.INTERFACE.value
+HEADER_MEMBER = HeaderField.MEMBER.value
+HEADER_ERROR_NAME = HeaderField.ERROR_NAME.value
+HEADER_REPLY_SERIAL = HeaderField.REPLY_SERIAL.value
+HEADER_DESTINATION = HeaderField.DESTINATION.value
+HEADER_SIGNATURE = HeaderField.SIGNATURE.value
+HEADER_UNIX_FDS = HeaderField.UNIX_FDS.value
+
+# header field values are validated when the message is constructed, so their
+# variants are built from the parsed types without verifying them again
+OBJECT_PATH_TYPE = SignatureTree._get('o').types[0]
+STRING_TYPE = SignatureTree._get('s').types[0]
+UINT32_TYPE = SignatureTree._get('u').types[0]
+SIGNATURE_TYPE = SignatureTree._get('g').types[0]
+
 REQUIRED_FIELDS = {
     MessageType.METHOD_CALL: ('path', 'member'),
     MessageType.SIGNAL: ('path', 'member', 'interface'),
@@ -80,7 +100,12 @@ class Message:
         self.interface = interface
         self.member = member
         self.message_type = message_type
-        self.flags = flags if type(flags) is MessageFlag else MessageFlag(bytes([flags]))
+        if type(flags) is MessageFlag:
+            self.flags = flags
+        else:
+            self.flags = MESSAGE_FLAG_MAP.get(flags)
+            if self.flags is None:
+                raise InvalidMessageError(f'invalid message flags: {flags!r}')
         self.error_name = error_name if type(error_name) is not ErrorType else error_name.value
         self.reply_serial = reply_serial
         self.sender = sender
@@ -211,32 +236,40 @@ class Message:
     def _marshall(self, negotiate_unix_fd=False):
         # TODO maximum message size is 134217728 (128 MiB)
         body_block = Marshaller(self.signature, self.body)
-        body_block.marshall()
 
         fields = []
 
         if self.path:
-            fields.append([HeaderField.PATH.value, Variant('o', self.path)])
+            fields.append([HEADER_PATH, Variant(OBJECT_PATH_TYPE, self.path, False)])
         if self.interface:
-            fields.append([HeaderField.INTERFACE.value, Variant('s', self.interface)])
+            fields.append([HEADER_INTERFACE, Variant(STRING_TYPE, self.interface, False)])
         if self.member:
-            fields.append([HeaderField.MEMBER.value, Variant('s', self.member)])
+            fields.append([HEADER_MEMBER, Variant(STRING_TYPE, self.member, False)])
         if self.error_name:
-            fields.append([HeaderField.ERROR_NAME.value, Variant('s', self.error_name)])
+            fields.append([HEADER_ERROR_NAME, Variant(STRING_TYPE, self.error_name, False)])
         if self.reply_serial:
-            fields.append([HeaderField.REPLY_SERIAL.value, Variant('u', self.reply_serial)])
+            fields.append([HEADER_REPLY_SERIAL, Variant(UINT32_TYPE, self.reply_serial)])
         if self.destination:
-            fields.append([HeaderField.DESTINATION.value, Variant('s', self.destination)])
+            fields.append([HEADER_DESTINATION, Variant(STRING_TYPE, self.destination, False)])
         if self.signature:
-            fields.append([HeaderField.SIGNATURE.value, Variant('g', self.signature)])
+            fields.append([HEADER_SIGNATURE, Variant(SIGNATURE_TYPE, self.signature, False)])
         if self.unix_fds and negotiate_unix_fd:
-            fields.append([HeaderField.UNIX_FDS.value, Variant('u', len(self.unix_fds))])
-
-        header_body = [
-            LITTLE_ENDIAN, self.message_type.value, self.flags.value, PROTOCOL_VERSION,
-            len(body_block.buffer), self.serial, fields
-        ]
-        header_block = Marshaller('yyyyuua(yv)', header_body)
-        header_block.marshall()
+            fields.append([HEADER_UNIX_FDS, Variant(UINT32_TYPE, len(self.unix_fds))])
+
+        header_block = Marshaller('a(yv)', [fields])
+        # the fixed part of the header is packed in one go, the header fields
+        # are marshalled after it so they are aligned from the message start
+        header_block.buffer.extend(
+            PACK_HEADER_PREFIX(LITTLE_ENDIAN, self.message_type.value, self.flags, PROTOCOL_VERSION,
+                               0, self.serial))
+        header_block.write_array(fields, header_block.signature_tree.types[0])
         header_block.align(8)
-        return header_block.buffer + body_block.buffer
+
+        # the body is marshalled into the same buffer right after the header,
+        # which ends 8-aligned, and its length is filled in afterwards
+        buffer = header_block.buffer
+        header_len = len(buffer)
+        body_block.buffer = buffer
+        body_block.write_body()
+        PACK_UINT32_INTO(buffer, 4, len(buffer) - header_len)
+        return buffer
@@ -10,6 +10,7 @@ from .proxy_object import BaseProxyObject
 from . import introspection as intr
 
 import inspect
+import itertools
 import socket
 import logging
 import xml.etree.ElementTree as ET
@@ -18,6 +19,45 @@ import traceback
 from typing import Type, Callable, Optional, Union
 
 
+class _SendReply:
+    __slots__ = ('_bus', '_msg')
+
+    def __init__(self, bus, msg):
+        self._bus = bus
+        self._msg = msg
+
+    def __enter__(self):
+        return self
+
+    def __call__(self, reply):
+        if self._msg.flags & MessageFlag.NO_REPLY_EXPECTED:
+            return
+
+        self._bus.send(reply)
+
+    def _exit(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            return
+
+        if issubclass(exc_type, DBusError):
+            self(exc_value._as_message(self._msg))
+            return True
+
+        if issubclass(exc_type, Exception):
+            self(
+                Message.new_error(
+                    self._msg, ErrorType.SERVICE_ERROR,
+                    f'The service interface raised an error: {exc_value}.\n{traceback.format_tb(tb)}'
+                ))
+            return True
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self._exit(exc_type, exc_value, tb)
+
+    def send_error(self, exc):
+        self._exit(exc.__class__, exc, exc.__traceback__)
+
+
 class BaseMessageBus:
     """An abstract class to manage a connection to a DBus message bus.
 
@@ -59,7 +99,7 @@ class BaseMessageBus:
         self._user_disconnect = False
 
         self._method_return_handlers = {}
-        self._serial = 0
+        self._next_serial = itertools.count(1).__next__
         self._user_message_handlers = []
         # the key is the name and the value is the unique name of the owner.
         # This cache is kept up to date by the NameOwnerChanged signal and is
@@ -68,6 +108,14 @@ class BaseMessageBus:
         self._name_owners = {}
         # used for the high level service
         self._path_exports = {}
+        # maps (path, interface, member, signature) of exported methods to
+        # their handlers so method calls are dispatched with one lookup
+        self._method_dispatch = {}
+        # maps id() of exported interfaces to the paths they are exported on,
+        # most recent last, so emitted signals can find their path without a
+        # scan. An entry only exists while _path_exports holds the interface,
+        # so the id cannot be reused by another object.
+        self._interface_paths = {}
         self._bus_address = parse_address(bus_address) if bus_address else parse_address(
             get_bus_address(bus_type))
         # the bus implementations need this rule for the high level client to
@@ -108,16 +156,16 @@ class BaseMessageBus:
         if not isinstance(interface, ServiceInterface):
             raise TypeError('interface must be a ServiceInterface')
 
-        if path not in self._path_exports:
-            self._path_exports[path] = []
+        exports = self._path_exports.setdefault(path, {})
 
-        for f in self._path_exports[path]:
-            if f.name == interface.name:
-                raise ValueError(
-                    f'An interface with this name is already exported on this bus at path "{path}": "{interface.name}"'
-                )
+        if interface.name in exports:
+            raise ValueError(
+                f'An interface with this name is already exported on this bus at path "{path}": "{interface.name}"'
+            )
 
-        self._path_exports[path].append(interface)
+        exports[interface.name] = interface
+        self._add_method_dispatch(path, interface)
+        self._interface_paths.setdefault(id(interface), []).append(path)
         ServiceInterface._add_bus(interface, self)
         self._emit_interface_added(path, interface)
 
@@ -145,27 +193,28 @@ class BaseMessageBus:
         exports = self._path_exports[path]
 
         if type(interface) is str:
-            try:
-                interface = next(iface for iface in exports if iface.name == interface)
-            except StopIteration:
+            interface = exports.get(interface)
+            if interface is None:
                 return
 
         removed_interfaces = []
         if interface is None:
             del self._path_exports[path]
-            for iface in filter(lambda e: not self._has_interface(e), exports):
+            for iface in exports.values():
+                self._remove_method_dispatch(path, iface)
+                self._remove_interface_path(path, iface)
+            for iface in filter(lambda e: not self._has_interface(e), exports.values()):
                 removed_interfaces.append(iface.name)
                 ServiceInterface._remove_bus(iface, self)
-        else:
-            for i, iface in enumerate(exports):
-                if iface is interface:
-                    removed_interfaces.append(iface.name)
-                    del self._path_exports[path][i]
-                    if not self._path_exports[path]:
-                        del self._path_exports[path]
-                    if not self._has_interface(iface):
-                        ServiceInterface._remove_bus(iface, self)
-                    break
+        elif exports.get(interface.name) is interface:
+            removed_interfaces.append(interface.name)
+            del exports[interface.name]
+            self._remove_method_dispatch(path, interface)
+            self._remove_interface_path(path, interface)
+            if not exports:
+                del self._path_exports[path]
+            if not self._has_interface(interface):
+                ServiceInterface._remove_bus(interface, self)
         self._emit_interface_removed(path, removed_interfaces)
 
     def introspect(self, bus_name: str, path: str,
@@ -397,8 +446,7 @@ class BaseMessageBus:
         :returns: The next serial for the bus.
         :rtype: int
         """
-        self._serial += 1
-        return self._serial
+        return self._next_serial()
 
     def add_message_handler(self, handler: Callable[[Message], Optional[Union[Message, bool]]]):
         """Add a custom message handler for incoming messages.
@@ -431,10 +479,12 @@ class BaseMessageBus:
         :param handler: A message handler.
         :type handler: :class:`Callable`
         """
-        for i, h in enumerate(self._user_message_handlers):
-            if h == handler:
-                del self._user_message_handlers[i]
-                break
+        # list.remove() tries identity before equality, and equality is still
+        # needed for bound methods which are a new object on each access
+        try:
+            self._user_message_handlers.remove(handler)
+        except ValueError:
+            pass
 
     def send(self, msg: Message) -> None:
         """Asynchronously send a message on the message bus.
@@ -466,12 +516,13 @@ class BaseMessageBus:
         self._user_message_handlers.clear()
 
     def _has_interface(self, interface: ServiceInterface) -> bool:
-        for _, exports in self._path_exports.items():
-            for iface in exports:
-                if iface is interface:
-                    return True
+        return id(interface) in self._interface_paths
 
-        return False
+    def _remove_interface_path(self, path, interface):
+        paths = self._interface_paths[id(interface)]
+        paths.remove(path)
+        if not paths:
+            del self._interface_paths[id(interface)]
 
     def _interface_signal_notify(self,
                                  interface,
@@ -480,17 +531,12 @@ class BaseMessageBus:
                                  signature,
                                  body,
                                  unix_fds=[]):
-        path = None
-        for p, ifaces in self._path_exports.items():
-            for i in ifaces:
-                if i is interface:
-                    path = p
-
-        if path is None:
+        paths = self._interface_paths.get(id(interface))
+        if not paths:
             raise Exception('Could not find interface on bus (this is a bug in dbus-next)')
 
         self.send(
-            Message.new_signal(path=path,
+            Message.new_signal(path=paths[-1],
                                interface=interface_name,
                                member=member,
                                signature=signature,
@@ -501,8 +547,8 @@ class BaseMessageBus:
         assert_object_path_valid(path)
 
         if path in self._path_exports:
-            node = intr.Node.default(path)
-            for interface in self._path_exports[path]:
+            node = intr.Node(path, interfaces=list(intr.Node._shared_default_interfaces()))
+            for interface in self._path_exports[path].values():
                 node.interfaces.append(interface.introspect())
         else:
             node = intr.Node(path)
@@ -534,7 +580,6 @@ class BaseMessageBus:
 
             if transport == 'unix':
                 self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                self._stream = self._sock.makefile('rwb')
                 self._fd = self._sock.fileno()
 
                 if 'path' in options:
@@ -553,7 +598,6 @@ class BaseMessageBus:
 
             elif transport == 'tcp':
                 self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self._stream = self._sock.makefile('rwb')
                 self._fd = self._sock.fileno()
 
                 if 'host' in options:
@@ -609,9 +653,9 @@ class BaseMessageBus:
     def _check_method_return(msg, err, signature):
         if err:
             raise err
-        elif msg.message_type == MessageType.METHOD_RETURN and msg.signature == signature:
+        elif msg.message_type is MessageType.METHOD_RETURN and msg.signature == signature:
             return
-        elif msg.message_type == MessageType.ERROR:
+        elif msg.message_type is MessageType.ERROR:
             raise DBusError._from_message(msg)
         else:
             raise DBusError(ErrorType.INTERNAL_ERROR, 'invalid message type for method call', msg)
@@ -620,48 +664,14 @@ class BaseMessageBus:
         try:
             self._process_message(msg)
         except Exception as e:
-            logging.error(
-                f'got unexpected error processing a message: {e}.\n{traceback.format_exc()}')
+            logging.error(f'got unexpected error processing a message: {e}.', exc_info=True)
 
     def _send_reply(self, msg):
-        bus = self
-
-        class SendReply:
-            def __enter__(self):
-                return self
-
-            def __call__(self, reply):
-                if msg.flags & MessageFlag.NO_REPLY_EXPECTED:
-                    return
-
-                bus.send(reply)
-
-            def _exit(self, exc_type, exc_value, tb):
-                if exc_type is None:
-                    return
-
-                if issubclass(exc_type, DBusError):
-                    self(exc_value._as_message(msg))
-                    return True
-
-                if issubclass(exc_type, Exception):
-                    self(
-                        Message.new_error(
-                            msg, ErrorType.SERVICE_ERROR,
-                            f'The service interface raised an error: {exc_value}.\n{traceback.format_tb(tb)}'
-                        ))
-                    return True
-
-            def __exit__(self, exc_type, exc_value, tb):
-                self._exit(exc_type, exc_value, tb)
-
-            def send_error(self, exc):
-                self._exit(exc.__class__, exc, exc.__traceback__)
-
-        return SendReply()
+        return _SendReply(self, msg)
 
     def _process_message(self, msg):
         handled = False
+        message_type = msg.message_type
 
         for handler in self._user_message_handlers:
             try:
@@ -672,17 +682,15 @@ class BaseMessageBus:
                     handled = True
                     break
             except DBusError as e:
-                if msg.message_type == MessageType.METHOD_CALL:
+                if message_type is MessageType.METHOD_CALL:
                     self.send(e._as_message(msg))
                     handled = True
                     break
                 else:
-                    logging.error(
-                        f'A message handler raised an exception: {e}.\n{traceback.format_exc()}')
+                    logging.error(f'A message handler raised an exception: {e}.', exc_info=True)
             except Exception as e:
-                logging.error(
-                    f'A message handler raised an exception: {e}.\n{traceback.format_exc()}')
-                if msg.message_type == MessageType.METHOD_CALL:
+                logging.error(f'A message handler raised an exception: {e}.', exc_info=True)
+                if message_type is MessageType.METHOD_CALL:
                     self.send(
                         Message.new_error(
                             msg, ErrorType.INTERNAL_ERROR,
@@ -690,18 +698,18 @@ class BaseMessageBus:
                     handled = True
                     break
 
-        if msg.message_type == MessageType.SIGNAL:
-            if msg._matches(sender='org.freedesktop.DBus',
-                            path='/org/freedesktop/DBus',
-                            interface='org.freedesktop.DBus',
-                            member='NameOwnerChanged'):
-                [name, old_owner, new_owner] = msg.body
-                if new_owner:
-                    self._name_owners[name] = new_owner
-                elif name in self._name_owners:
-                    del self._name_owners[name]
-
-        elif msg.message_type == MessageType.METHOD_CALL:
+        if message_type is MessageType.SIGNAL:
+            # compare the fields directly instead of going through
+            # msg._matches(), the member rules out most signals first
+            if msg.member == 'NameOwnerChanged' and msg.sender == 'org.freedesktop.DBus':
+                if msg.path == '/org/freedesktop/DBus' and msg.interface == 'org.freedesktop.DBus':
+                    [name, old_owner, new_owner] = msg.body
+                    if new_owner:
+                        self._name_owners[name] = new_owner
+                    elif name in self._name_owners:
+                        del self._name_owners[name]
+
+        elif message_type is MessageType.METHOD_CALL:
             if not handled:
                 handler = self._find_message_handler(msg)
 
@@ -735,38 +743,44 @@ class BaseMessageBus:
 
         return handler
 
+    def _add_method_dispatch(self, path, interface):
+        for method in ServiceInterface._get_methods(interface):
+            if method.disabled:
+                continue
+            key = (path, interface.name, method.name, method.in_signature)
+            # the first method defined with a given member and signature wins
+            if key not in self._method_dispatch:
+                self._method_dispatch[key] = self._make_method_handler(interface, method)
+
+    def _remove_method_dispatch(self, path, interface):
+        for method in ServiceInterface._get_methods(interface):
+            self._method_dispatch.pop((path, interface.name, method.name, method.in_signature),
+                                      None)
+
     def _find_message_handler(self, msg):
         handler = None
+        interface = msg.interface
+        member = msg.member
+        signature = msg.signature
 
-        if msg._matches(interface='org.freedesktop.DBus.Introspectable',
-                        member='Introspect',
-                        signature=''):
+        if interface == 'org.freedesktop.DBus.Introspectable' and member == 'Introspect' \
+                and signature == '':
             handler = self._default_introspect_handler
 
-        elif msg._matches(interface='org.freedesktop.DBus.Properties'):
+        elif interface == 'org.freedesktop.DBus.Properties':
             handler = self._default_properties_handler
 
-        elif msg._matches(interface='org.freedesktop.DBus.Peer'):
-            if msg._matches(member='Ping', signature=''):
+        elif interface == 'org.freedesktop.DBus.Peer':
+            if member == 'Ping' and signature == '':
                 handler = self._default_ping_handler
-            elif msg._matches(member='GetMachineId', signature=''):
+            elif member == 'GetMachineId' and signature == '':
                 handler = self._default_get_machine_id_handler
-        elif msg._matches(interface='org.freedesktop.DBus.ObjectManager',
-                          member='GetManagedObjects'):
+
+        elif interface == 'org.freedesktop.DBus.ObjectManager' and member == 'GetManagedObjects':
             handler = self._default_get_managed_objects_handler
 
         else:
-            for interface in self._path_exports.get(msg.path, []):
-                for method in ServiceInterface._get_methods(interface):
-                    if method.disabled:
-                        continue
-                    if msg._matches(interface=interface.name,
-                                    member=method.name,
-                                    signature=method.in_signature):
-                        handler = self._make_method_handler(interface, method)
-                        break
-                if handler:
-                    break
+            handler = self._method_dispatch.get((msg.path, interface, member, signature))
 
         return handler
 
@@ -787,10 +801,10 @@ class BaseMessageBus:
                 # the bus has been disconnected, cannot send a reply
                 return
 
-            if reply.message_type == MessageType.METHOD_RETURN:
+            if reply.message_type is MessageType.METHOD_RETURN:
                 self._machine_id = reply.body[0]
                 send_reply(Message.new_method_return(msg, 's', [self._machine_id]))
-            elif reply.message_type == MessageType.ERROR:
+            elif reply.message_type is MessageType.ERROR:
                 send_reply(Message.new_error(msg, reply.error_name, reply.body))
             else:
                 send_reply(Message.new_error(msg, ErrorType.FAILED, 'could not get machine_id'))
@@ -824,7 +838,7 @@ class BaseMessageBus:
         # first build up the result object to know when it's complete
         for node in nodes:
             result[node] = {}
-            for interface in self._path_exports[node]:
+            for interface in self._path_exports[node].values():
                 result[node][interface.name] = None
 
         if is_result_complete():
@@ -845,7 +859,7 @@ class BaseMessageBus:
                 send_reply(Message.new_method_return(msg, result_signature, [result]))
 
         for node in nodes:
-            for interface in self._path_exports[node]:
+            for interface in self._path_exports[node].values():
                 ServiceInterface._get_all_property_values(interface, get_all_properties_callback,
                                                           node)
 
@@ -867,8 +881,8 @@ class BaseMessageBus:
         elif msg.path not in self._path_exports:
             raise DBusError(ErrorType.UNKNOWN_OBJECT, f'no interfaces at path: "{msg.path}"')
 
-        match = [iface for iface in self._path_exports[msg.path] if iface.name == interface_name]
-        if not match:
+        interface = self._path_exports[msg.path].get(interface_name)
+        if interface is None:
             if interface_name in [
                     'org.freedesktop.DBus.Properties', 'org.freedesktop.DBus.Introspectable',
                     'org.freedesktop.DBus.Peer', 'org.freedesktop.DBus.ObjectManager'
@@ -888,7 +902,6 @@ class BaseMessageBus:
                 ErrorType.UNKNOWN_INTERFACE,
                 f'could not find an interface "{interface_name}" at path: "{msg.path}"')
 
-        interface = match[0]
         properties = ServiceInterface._get_properties(interface)
 
         if msg.member == 'Get' or msg.member == 'Set':
@@ -967,7 +980,7 @@ class BaseMessageBus:
             if err:
                 logging.error(
                     f'add match request failed. match="{self._name_owner_match_rule}", {err}')
-            if msg.message_type == MessageType.ERROR:
+            if msg.message_type is MessageType.ERROR:
                 logging.error(
                     f'add match request failed. match="{self._name_owner_match_rule}", {msg.body[0]}'
                 )
@@ -996,7 +1009,7 @@ class BaseMessageBus:
         def add_match_notify(msg, err):
             if err:
                 logging.error(f'add match request failed. match="{match_rule}", {err}')
-            if msg.message_type == MessageType.ERROR:
+            if msg.message_type is MessageType.ERROR:
                 logging.error(f'add match request failed. match="{match_rule}", {msg.body[0]}')
 
         self._call(
@@ -1026,7 +1039,7 @@ class BaseMessageBus:
 
             if err:
                 logging.error(f'remove match request failed. match="{match_rule}", {err}')
-            if msg.message_type == MessageType.ERROR:
+            if msg.message_type is MessageType.ERROR:
                 logging.error(f'remove match request failed. match="{match_rule}", {msg.body[0]}')
 
         self._call(
@@ -7,6 +7,7 @@ from .errors import DBusError, InterfaceNotFoundError
 from ._private.util import replace_idx_with_fds
 
 from typing import Type, Union, List, Coroutine
+from functools import lru_cache
 import logging
 import xml.etree.ElementTree as ET
 import inspect
@@ -52,15 +53,16 @@ class BaseProxyInterface:
     _underscorer2 = re.compile(r'([a-z0-9])([A-Z])')
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _to_snake_case(member):
         subbed = BaseProxyInterface._underscorer1.sub(r'\1_\2', member)
         return BaseProxyInterface._underscorer2.sub(r'\1_\2', subbed).lower()
 
     @staticmethod
     def _check_method_return(msg, signature=None):
-        if msg.message_type == MessageType.ERROR:
+        if msg.message_type is MessageType.ERROR:
             raise DBusError._from_message(msg)
-        elif msg.message_type != MessageType.METHOD_RETURN:
+        elif msg.message_type is not MessageType.METHOD_RETURN:
             raise DBusError(ErrorType.CLIENT_ERROR, 'method call didnt return a method return', msg)
         elif signature is not None and msg.signature != signature:
             raise DBusError(ErrorType.CLIENT_ERROR,
@@ -73,9 +75,12 @@ class BaseProxyInterface:
         raise NotImplementedError('this must be implemented in the inheriting class')
 
     def _message_handler(self, msg):
-        if not msg._matches(message_type=MessageType.SIGNAL,
-                            interface=self.introspection.name,
-                            path=self.path) or msg.member not in self._signal_handlers:
+        # this runs for every message the bus receives, so compare the fields
+        # directly instead of going through msg._matches()
+        if msg.message_type is not MessageType.SIGNAL or msg.member not in self._signal_handlers:
+            return
+
+        if msg.interface != self.introspection.name or msg.path != self.path:
             return
 
         if msg.sender != self.bus_name and self.bus._name_owners.get(self.bus_name,
@@ -231,7 +236,7 @@ class BaseProxyObject:
             if err:
                 logging.error(f'getting name owner for "{name}" failed, {err}')
                 return
-            if msg.message_type == MessageType.ERROR:
+            if msg.message_type is MessageType.ERROR:
                 if msg.error_name != ErrorType.NAME_HAS_NO_OWNER.value:
                     logging.error(f'getting name owner for "{name}" failed, {msg.body[0]}')
                 return
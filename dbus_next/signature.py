@@ -2,7 +2,7 @@ from .validators import is_object_path_valid
 from .errors import InvalidSignatureError, SignatureBodyMismatchError
 
 from functools import lru_cache
-from typing import Any, List, Union
+from typing import Any, List, Tuple, Union
 
 
 class SignatureType:
@@ -324,19 +324,20 @@ class SignatureTree:
         else:
             return super().__eq__(other)
 
-    def verify(self, body: List[Any]):
+    def verify(self, body: Union[List[Any], Tuple[Any, ...]]):
         """Verifies that the give body matches this signature tree
 
         :param body: the body to verify for this tree
-        :type body: list(Any)
+        :type body: list(Any) or tuple(Any)
 
         :returns: True if the signature matches the body or an exception if not.
 
         :raises:
             :class:`SignatureBodyMismatchError` if the signature does not match the body.
         """
-        if not isinstance(body, list):
-            raise SignatureBodyMismatchError(f'The body must be a list (got {type(body)})')
+        if not isinstance(body, (list, tuple)):
+            raise SignatureBodyMismatchError(
+                f'The body must be a list or tuple (got {type(body)})')
         if len(body) != len(self.types):
             raise SignatureBodyMismatchError(
                 f'The body has the wrong number of types (got {len(body)}, expected {len(self.types)})'
@@ -8,7 +8,7 @@ _element_re = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
 _member_re = re.compile(r'^[A-Za-z_][A-Za-z0-9_-]*$')
 
 
-@lru_cache(maxsize=32)
+@lru_cache(maxsize=512)
 def is_bus_name_valid(name: str) -> bool:
     """Whether this is a valid bus name.
 
@@ -74,7 +74,7 @@ def is_object_path_valid(path: str) -> bool:
     return True
 
 
-@lru_cache(maxsize=32)
+@lru_cache(maxsize=512)
 def is_interface_name_valid(name: str) -> bool:
     """Whether this is a valid interface name.
 
@@ -164,3 +164,65 @@ async def test_methods(interface_class):
 
     reply = await call('throws_dbus_error', flags=MessageFlag.NO_REPLY_EXPECTED)
     assert reply is None
+
+
+@pytest.mark.asyncio
+async def test_method_dispatch_after_export_changes():
+    bus1 = await MessageBus().connect()
+    bus2 = await MessageBus().connect()
+
+    interface = ExampleInterface('test.interface')
+
+    async def call(path, member='ping', signature='', body=[], interface_name=interface.name):
+        return await bus2.call(
+            Message(destination=bus1.unique_name,
+                    path=path,
+                    interface=interface_name,
+                    member=member,
+                    signature=signature,
+                    body=body))
+
+    bus1.export('/test/path', interface)
+    reply = await call('/test/path')
+    assert reply.message_type == MessageType.METHOD_RETURN, reply.body[0]
+
+    # a method with the wrong signature is not found
+    reply = await call('/test/path', 'echo', 'ss', ['hello', 'world'])
+    assert reply.message_type == MessageType.ERROR
+    assert reply.error_name == ErrorType.UNKNOWN_METHOD.value, reply.body[0]
+
+    # disabled methods are not found
+    reply = await call('/test/path', 'not_here')
+    assert reply.error_name == ErrorType.UNKNOWN_METHOD.value, reply.body[0]
+
+    # unknown members of the standard interfaces get the standard error
+    reply = await call('/test/path', 'Pong', interface_name='org.freedesktop.DBus.Peer')
+    assert reply.error_name == ErrorType.UNKNOWN_METHOD.value, reply.body[0]
+
+    bus1.unexport('/test/path', interface)
+    reply = await call('/test/path')
+    assert reply.error_name == ErrorType.UNKNOWN_METHOD.value, reply.body[0]
+
+    bus1.export('/test/path', interface)
+    reply = await call('/test/path')
+    assert reply.message_type == MessageType.METHOD_RETURN, reply.body[0]
+
+    # one interface on two paths
+    bus1.export('/test/path2', interface)
+    reply = await call('/test/path2')
+    assert reply.message_type == MessageType.METHOD_RETURN, reply.body[0]
+
+    bus1.unexport('/test/path', interface)
+    reply = await call('/test/path')
+    assert reply.error_name == ErrorType.UNKNOWN_METHOD.value, reply.body[0]
+    reply = await call('/test/path2', 'echo', 's', ['hello'])
+    assert reply.message_type == MessageType.METHOD_RETURN, reply.body[0]
+    assert reply.body == ['hello']
+
+    bus1.unexport('/test/path2')
+    reply = await call('/test/path2')
+    assert reply.error_name == ErrorType.UNKNOWN_METHOD.value, reply.body[0]
+    assert not bus1._method_dispatch
+
+    bus1.disconnect()
+    bus2.disconnect()
@@ -210,3 +210,63 @@ async def test_interface_add_remove_signal():
                          member='InterfacesRemoved',
                          signature='oas',
                          body=[export_path, ['test.interface.first', 'test.interface.second']])
+
+
+@pytest.mark.asyncio
+async def test_signal_path_after_partial_unexport():
+    bus1 = await MessageBus().connect()
+    bus2 = await MessageBus().connect()
+
+    await bus2.call(
+        Message(destination='org.freedesktop.DBus',
+                path='/org/freedesktop/DBus',
+                interface='org.freedesktop.DBus',
+                member='AddMatch',
+                signature='s',
+                body=[f'sender={bus1.unique_name}']))
+
+    interface = ExampleInterface('test.interface')
+    other_interface = SecondExampleInterface('test.interface.second')
+    bus1.export('/test/path1', interface)
+    bus1.export('/test/path1', other_interface)
+    bus1.export('/test/path2', interface)
+
+    # signals are emitted on the path the interface was exported on last
+    async with ExpectMessage(bus1, bus2, interface.name) as expected_signal:
+        interface.signal_simple()
+        assert_signal_ok(signal=await expected_signal,
+                         export_path='/test/path2',
+                         member='signal_simple',
+                         signature='s',
+                         body=['hello'])
+
+    bus1.unexport('/test/path2', interface)
+
+    async with ExpectMessage(bus1, bus2, interface.name) as expected_signal:
+        interface.signal_simple()
+        assert_signal_ok(signal=await expected_signal,
+                         export_path='/test/path1',
+                         member='signal_simple',
+                         signature='s',
+                         body=['hello'])
+
+    bus1.export('/test/path2', interface)
+    bus1.unexport('/test/path1', interface)
+
+    async with ExpectMessage(bus1, bus2, interface.name) as expected_signal:
+        interface.signal_simple()
+        assert_signal_ok(signal=await expected_signal,
+                         export_path='/test/path2',
+                         member='signal_simple',
+                         signature='s',
+                         body=['hello'])
+
+    bus1.unexport('/test/path2')
+    assert id(interface) not in bus1._interface_paths
+    assert id(other_interface) in bus1._interface_paths
+
+    bus1.unexport('/test/path1')
+    assert not bus1._interface_paths
+
+    bus1.disconnect()
+    bus2.disconnect()
@@ -1,6 +1,7 @@
 from dbus_next.aio import MessageBus
 from dbus_next import Message, MessageType, MessageFlag
 
+import asyncio
 import pytest
 
 
@@ -99,6 +100,12 @@ async def test_sending_messages_between_buses():
     reply = await bus2.call(msg)
     assert reply is None
 
+    # flags may also be assigned as a plain int
+    msg.serial = bus2.next_serial()
+    msg.flags = 1
+    reply = await bus2.call(msg)
+    assert reply is None
+
 
 @pytest.mark.asyncio
 async def test_sending_signals_between_buses(event_loop):
@@ -136,3 +143,28 @@ async def test_sending_signals_between_buses(event_loop):
     assert signal.member == 'SomeSignal'
     assert signal.signature == 's'
     assert signal.body == ['a signal']
+
+
+@pytest.mark.asyncio
+async def test_sending_many_messages_at_once():
+    bus = await MessageBus().connect()
+
+    # these are queued before the writer runs and go out in batches
+    calls = [
+        bus.call(
+            Message(destination='org.freedesktop.DBus',
+                    path='/org/freedesktop/DBus',
+                    interface='org.freedesktop.DBus.Peer',
+                    member='Ping')) for _ in range(100)
+    ]
+    sends = [
+        bus.send(Message.new_signal('/org/test/path', 'org.test.interface', 'SomeSignal', 'i', [i]))
+        for i in range(100)
+    ]
+
+    replies = await asyncio.gather(*calls)
+    await asyncio.gather(*sends)
+
+    assert len({reply.reply_serial for reply in replies}) == 100
+    for reply in replies:
+        assert reply.message_type == MessageType.METHOD_RETURN
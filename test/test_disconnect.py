@@ -1,6 +1,7 @@
 from dbus_next.aio import MessageBus
-from dbus_next import Message
+from dbus_next import Message, MessageType
 
+import asyncio
 import os
 import pytest
 import functools
@@ -54,3 +55,31 @@ async def test_unexpected_disconnect(event_loop):
 
     with pytest.raises(OSError):
         await bus.wait_for_disconnect()
+
+
+@pytest.mark.asyncio
+async def test_send_after_disconnect_does_not_affect_other_bus():
+    '''A bus that has disconnected must not touch the fd of a bus connected
+    after it when it is used to send again.'''
+    bus1 = await MessageBus().connect()
+    bus1.disconnect()
+    await bus1.wait_for_disconnect()
+
+    bus2 = await MessageBus().connect()
+
+    with pytest.raises(OSError):
+        await bus1.send(
+            Message(destination='org.freedesktop.DBus',
+                    path='/org/freedesktop/DBus',
+                    interface='org.freedesktop.DBus.Peer',
+                    member='Ping'))
+
+    reply = await asyncio.wait_for(
+        bus2.call(
+            Message(destination='org.freedesktop.DBus',
+                    path='/org/freedesktop/DBus',
+                    interface='org.freedesktop.DBus.Peer',
+                    member='Ping')), 1)
+    assert reply.message_type == MessageType.METHOD_RETURN
+
+    bus2.disconnect()
@@ -1,6 +1,7 @@
 from dbus_next import introspection as intr, ArgDirection, PropertyAccess, SignatureType
 
 import os
+import xml.etree.ElementTree as ET
 
 example_data = open(f'{os.path.dirname(__file__)}/data/introspection.xml', 'r').read()
 
@@ -116,7 +117,64 @@ def test_example_introspection_to_xml():
     assert prop.attrib.get('access') == 'write'
 
 
+def elementtree_tostring(node):
+    # how Node.tostring() serialized to_xml() before it wrote the string
+    # directly
+    header = '<!DOCTYPE node PUBLIC "-//freedesktop//DTD D-BUS Object Introspection 1.0//EN"\n"http://www.freedesktop.org/standards/dbus/1.0/introspect.dtd">\n'
+
+    def indent(elem, level=0):
+        i = "\n" + level * "    "
+        if len(elem):
+            if not elem.text or not elem.text.strip():
+                elem.text = i + "  "
+            if not elem.tail or not elem.tail.strip():
+                elem.tail = i
+            for elem in elem:
+                indent(elem, level + 1)
+            if not elem.tail or not elem.tail.strip():
+                elem.tail = i
+        else:
+            if level and (not elem.tail or not elem.tail.strip()):
+                elem.tail = i
+
+    xml = node.to_xml()
+    indent(xml)
+    return header + ET.tostring(xml, encoding='unicode').rstrip()
+
+
+def test_example_introspection_tostring():
+    node = intr.Node.parse(example_data)
+    node.nodes.append(intr.Node('a&b<"c">'))
+    data = node.tostring()
+
+    # the string is written directly, it must match serializing to_xml()
+    assert data == elementtree_tostring(node)
+    assert '<node name="a&amp;b&lt;&quot;c&quot;&gt;" />' in data
+
+    assert intr.Node.parse(data).tostring() == data
+
+    default_node = intr.Node.default('/test')
+    assert default_node.tostring() == elementtree_tostring(default_node)
+
+
 def test_default_interfaces():
     # just make sure it doesn't throw
     default = intr.Node.default()
     assert type(default) is intr.Node
+
+    # the bus shares one set of default interfaces, default() must not
+    other = intr.Node.default()
+    assert other.interfaces is not default.interfaces
+    shared = intr.Node._shared_default_interfaces()
+    for interface in default.interfaces:
+        assert interface not in shared
+    assert [i.name for i in default.interfaces] == [i.name for i in shared]
+
+
+def test_method_default_args_are_not_shared():
+    method = intr.Method('Foo')
+    method.in_args.append(intr.Arg('s', ArgDirection.IN, 'bar'))
+
+    other = intr.Method('Foo')
+    assert other.in_args == []
+    assert other.out_args == []
@@ -1,10 +1,13 @@
 from typing import Any, Dict
 from dbus_next._private.unmarshaller import Unmarshaller
 from dbus_next import Message, Variant, SignatureTree, MessageType, MessageFlag
+from dbus_next.errors import SignatureBodyMismatchError, InvalidMessageError
 
 import json
 import os
 import io
+import socket
+from struct import pack
 
 import pytest
 
@@ -164,3 +167,111 @@ def test_ay_buffer():
     marshalled = msg._marshall()
     unmarshalled_msg = Unmarshaller(io.BytesIO(marshalled)).unmarshall()
     assert unmarshalled_msg.body[0] == body[0]
+
+
+def test_unmarshall_fixed_width_arrays():
+    body = [[-1, 0, 1], [0, 2**16 - 1], [-2**31, 2**31 - 1], [2**32 - 1], [-2**63, 2**63 - 1],
+            [2**64 - 1], [1.5, -2.25], []]
+    msg = Message(path="/test", member="test", signature="anaqaiauaxatadai", body=body)
+    unmarshalled_msg = Unmarshaller(io.BytesIO(msg._marshall())).unmarshall()
+    assert unmarshalled_msg.body == body
+
+
+def test_unmarshaller_reset():
+    first = Message(path="/test", member="first", signature="s", body=["hello"])
+    second = Message(path="/test", member="second", signature="ai", body=[[1, 2, 3]])
+    unmarshaller = Unmarshaller(io.BytesIO(first._marshall() + second._marshall()))
+
+    assert unmarshaller.unmarshall().member == "first"
+    unmarshaller.reset()
+    message = unmarshaller.unmarshall()
+    assert message.member == "second"
+    assert message.body == [[1, 2, 3]]
+
+
+def test_unmarshaller_reset_keeps_pipelined_bytes():
+    first = Message(path="/test", member="first", signature="s", body=["hello"])
+    second = Message(path="/test", member="second", signature="u", body=[7])
+    unmarshaller = Unmarshaller(io.BytesIO(b""))
+    # both messages arrived in a single read
+    unmarshaller.buf.extend(first._marshall() + second._marshall())
+
+    assert unmarshaller.unmarshall().member == "first"
+    unmarshaller.reset()
+    message = unmarshaller.unmarshall()
+    assert message.member == "second"
+    assert message.body == [7]
+    unmarshaller.reset()
+    assert not unmarshaller.buf
+
+
+def test_unmarshall_big_endian_arrays():
+    # the marshaller only writes little endian, so build the message by hand
+    fields = b"".join([
+        b"\x01\x01o\x00" + pack(">I", 5) + b"/test\x00" + bytes(2),
+        b"\x03\x01s\x00" + pack(">I", 4) + b"test\x00" + bytes(3),
+        b"\x08\x01g\x00\x04anax\x00",
+    ])
+    body = pack(">I", 4) + pack(">hh", -1, 2) + pack(">I", 8) + bytes(4) + pack(">q", -2**63)
+    header = pack(">cBBBIII", b"B", 1, 0, 1, len(body), 1, len(fields)) + fields
+    data = header + bytes(-len(header) & 7) + body
+
+    message = Unmarshaller(io.BytesIO(data)).unmarshall()
+    assert message.member == "test"
+    assert message.signature == "anax"
+    assert message.body == [[-1, 2], [-2**63]]
+
+
+def test_unmarshall_read_ahead_from_socket():
+    first = Message(path="/test", member="first", signature="s", body=["hello"])
+    second = Message(path="/test", member="second", signature="u", body=[7])
+    sock, peer = socket.socketpair()
+    with sock, peer:
+        sock.setblocking(False)
+        peer.sendall(first._marshall() + second._marshall())
+        unmarshaller = Unmarshaller(None, sock, negotiate_unix_fd=False)
+
+        assert unmarshaller.unmarshall().member == "first"
+        unmarshaller.reset()
+        # the second message was read along with the first one
+        peer.close()
+        assert unmarshaller.unmarshall().member == "second"
+        unmarshaller.reset()
+        with pytest.raises(EOFError):
+            unmarshaller.unmarshall()
+
+
+def test_unmarshall_dict_followed_by_unaligned_value():
+    # the last entry of the dict does not end on an 8 byte boundary
+    body = [{"a": 1, "bc": 2}, 3]
+    msg = Message(path="/test", member="test", signature="a{sy}y", body=body)
+    unmarshalled_msg = Unmarshaller(io.BytesIO(msg._marshall())).unmarshall()
+    assert unmarshalled_msg.body == body
+
+
+def test_combined_message_flags():
+    flags = MessageFlag.NO_REPLY_EXPECTED | MessageFlag.NO_AUTOSTART
+    message = Message(path='/test', member='Combined', flags=int(flags))
+    assert type(message.flags) is MessageFlag
+    assert message.flags == flags
+
+    unmarshalled = Unmarshaller(io.BytesIO(message._marshall())).unmarshall()
+    assert type(unmarshalled.flags) is MessageFlag
+    assert unmarshalled.flags == flags
+
+
+def test_invalid_message_flags():
+    with pytest.raises(InvalidMessageError):
+        Message(path='/test', member='Invalid', flags=8)
+
+    with pytest.raises(InvalidMessageError):
+        Message(path='/test', member='Invalid', flags='1')
+
+
+def test_marshall_invalid_reply_serial():
+    msg = Message.new_method_return(
+        Message(destination='org.test', path='/test', member='Test', serial=1))
+    msg.reply_serial = 'not a serial'
+
+    with pytest.raises(SignatureBodyMismatchError):
+        msg._marshall()
@@ -1,5 +1,5 @@
 from dbus_next import SignatureTree, SignatureBodyMismatchError, Variant
-from dbus_next._private.util import signature_contains_type
+from dbus_next._private.util import signature_contains_type, replace_fds_with_idx
 
 import pytest
 
@@ -213,3 +213,16 @@ def test_invalid_variants():
 
     with pytest.raises(SignatureBodyMismatchError):
         tree.verify([con])
+
+
+def test_verify_body_sequence():
+    tree = SignatureTree('sh')
+    assert tree.verify(['foo', 0])
+    assert tree.verify(('foo', 0))
+
+    with pytest.raises(SignatureBodyMismatchError):
+        tree.verify({'foo': 0})
+
+    body, unix_fds = replace_fds_with_idx(tree, ('foo', 7))
+    assert body == ['foo', 0]
+    assert unix_fds == [7]
@@ -61,7 +61,7 @@ async def test_tcp_connection_with_forwarding(event_loop):
     assert bus._sock.getpeername()[0] == host
     assert bus._sock.getsockname()[0] == host
     assert bus._sock.gettimeout() == 0
-    assert bus._stream.closed is False
+    assert bus._sock.fileno() != -1
 
     for c in closables:
         c.close()